@@ -53,6 +53,16 @@ typedef struct {
 static fuzz_feedback_t feedback = {0};
 static jmp_buf crash_handler;
 
+/*
+ * In-process crash recovery (standalone builds only).
+ *
+ * Under AFL instrumentation the handlers must stay uninstalled: the
+ * longjmp recovery would swallow SIGSEGV/SIGABRT inside __AFL_LOOP and
+ * the forkserver would report a clean status, hiding the crash from
+ * the fuzzer entirely. AFL builds let the raw signal kill the process
+ * so it surfaces as a signal death.
+ */
+#ifndef __AFL_HAVE_MANUAL_CONTROL
 /* Signal handler for crash detection */
 static void signal_handler(int signum)
 {
@@ -84,6 +94,7 @@ static void install_handlers(void)
     signal(SIGFPE, signal_handler);
     signal(SIGILL, signal_handler);
 }
+#endif /* !__AFL_HAVE_MANUAL_CONTROL */
 
 /* Fuzz target: KLV metadata parser */
 static int fuzz_klv_parser(const uint8_t *data, size_t size)
@@ -310,6 +321,12 @@ int main(int argc, char **argv)
     uint8_t input_buf[MAX_INPUT_SIZE];
     ssize_t input_len;
     fuzz_target_t target = FUZZ_TARGET_KLV_PARSER;
+    int rc = 0;
+
+    /* Install crash handlers (standalone builds only, see above) */
+#ifndef __AFL_HAVE_MANUAL_CONTROL
+    install_handlers();
+#endif
 
     /* Parse command-line arguments */
     if (argc > 1) {
@@ -327,25 +344,38 @@ int main(int argc, char **argv)
         if (argc > 2) {
             target = atoi(argv[2]) % FUZZ_TARGET_COUNT;
         }
+
+        rc = fuzz_iteration(target, input_buf, input_len);
     } else {
-        /* Stdin-based fuzzing (AFL mode) */
-        input_len = read(STDIN_FILENO, input_buf, MAX_INPUT_SIZE);
-        if (input_len < 0) {
-            return 1;
-        }
+        /*
+         * Stdin-based fuzzing (AFL mode).
+         *
+         * When built with afl-clang-fast the loop below runs in AFL++
+         * persistent mode: the process is spawned once by the forkserver
+         * and re-reads a fresh input from stdin on every iteration,
+         * avoiding a fork+exec per input. Without AFL instrumentation
+         * the loop body executes exactly once.
+         */
+#ifdef __AFL_HAVE_MANUAL_CONTROL
+        __AFL_INIT();
+        while (__AFL_LOOP(10000)) {
+#endif
+            input_len = read(STDIN_FILENO, input_buf, MAX_INPUT_SIZE);
+            if (input_len < 0) {
+                return 1;
+            }
+
+            /* Select target based on first byte */
+            if (input_len > 0) {
+                target = input_buf[0] % FUZZ_TARGET_COUNT;
+            }
 
-        /* Select target based on first byte */
-        if (input_len > 0) {
-            target = input_buf[0] % FUZZ_TARGET_COUNT;
+            rc = fuzz_iteration(target, input_buf, input_len);
+#ifdef __AFL_HAVE_MANUAL_CONTROL
         }
+#endif
     }
 
-    /* Install crash handlers */
-    install_handlers();
-
-    /* Execute fuzzing iteration */
-    int rc = fuzz_iteration(target, input_buf, input_len);
-
     /* Export feedback for OpenVINO training */
     if (feedback.iterations % 1000 == 0) {
         export_feedback("fuzz/feedback.json");
@@ -24,14 +24,21 @@ import os
 import sys
 import json
 import time
+import ctypes
+import fcntl
+import hashlib
+import select
+import struct
 import subprocess
 import threading
+import multiprocessing
 import argparse
 import signal
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from collections import deque
 
 try:
     import numpy as np
@@ -41,12 +48,33 @@ except ImportError:
     print("Warning: NumPy not available, using fallback")
 
 try:
-    from openvino.runtime import Core
+    from openvino.runtime import Core, AsyncInferQueue
     HAVE_OPENVINO = True
 except ImportError:
     HAVE_OPENVINO = False
     print("Warning: OpenVINO not available, falling back to standard fuzzing")
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    print("Warning: Numba not available, using NumPy mutation path")
+
+try:
+    import xxhash
+    HAVE_XXHASH = True
+except ImportError:
+    HAVE_XXHASH = False
+
+
+def _input_hash(data) -> int:
+    """Fast 64-bit digest of an input buffer for crash/hang dedup"""
+    if HAVE_XXHASH:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(
+        hashlib.blake2b(data, digest_size=8).digest(), "little")
+
 
 @dataclass
 class DeviceConfig:
@@ -69,6 +97,527 @@ class FuzzingStats:
     last_new_path: float = 0.0
 
 
+# Per-worker slots in the shared-memory stats block. Workers update their
+# own row from their process; the monitor reads all rows. Counters are
+# intentionally unlocked - they are statistics, and int64 stores on
+# x86-64 are atomic enough for display purposes.
+STAT_FIELDS = 5            # int64 slots per worker
+STAT_ITER = 0              # iterations executed
+STAT_CRASHES = 1           # unique crashes found
+STAT_HANGS = 2             # hangs found
+STAT_EPS_X100 = 3          # execs/sec * 100 (fixed point)
+STAT_EDGES = 4             # coverage edges hit (forkserver mode only)
+
+# Structure-of-arrays view of the same block: one record per worker,
+# field layout matching the STAT_* slots, so the monitor can aggregate
+# each column with a single vectorized reduction
+if HAVE_NUMPY:
+    STATS_DTYPE = np.dtype([('iter', 'i8'), ('crash', 'i8'),
+                            ('hang', 'i8'), ('eps_x100', 'i8'),
+                            ('edges', 'i8')])
+
+
+def _sparse_masks(rng, shape) -> "np.ndarray":
+    """Sample sparse 64-bit XOR masks for SWAR bit flips
+
+    AND-ing three uniform 64-bit words leaves each bit set with
+    probability 1/8, or about 8 bits per mask - a havoc-sized flip
+    cluster applied with a single word-wide XOR. All-zero masks are
+    bumped to a single bit so every flip changes something.
+
+    Args:
+        rng: np.random.Generator to draw from
+        shape: Output shape, e.g. (count, max_flips)
+
+    Returns:
+        uint64 array of the requested shape
+    """
+    n = int(np.prod(shape))
+    raw = np.frombuffer(rng.bytes(n * 8 * 3), dtype=np.uint64)
+    masks = (raw[:n] & raw[n:2 * n] & raw[2 * n:]).copy()
+    masks[masks == 0] = 1
+    return masks.reshape(shape)
+
+
+if HAVE_NUMPY and HAVE_NUMBA:
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _batch_bitflip(seeds_flat, offsets, lengths, seed_idx, out, rnd_pos,
+                       rnd_masks, rnd_bits, num_flips):
+        """Fill each output row with a bit-flipped copy of its seed
+
+        Compiled mutation kernel: copies the selected seed out of the
+        flattened seed buffer and applies the pre-sampled flips in
+        native code, with rows processed in parallel. Seeds of 8+ bytes
+        take the SWAR path - each flip XORs a sparse 64-bit mask over 8
+        consecutive bytes, which LLVM folds into word-width stores -
+        while shorter seeds fall back to single-bit flips.
+
+        Args:
+            seeds_flat: All seed bytes concatenated (uint8[:])
+            offsets: Start of each seed within seeds_flat (int64[:])
+            lengths: Length of each seed (int64[:])
+            seed_idx: Seed index chosen for each output row (int64[:])
+            out: Pre-allocated output batch (uint8[:, :])
+            rnd_pos: Pre-sampled flip positions, reduced mod length (int64[:, :])
+            rnd_masks: Pre-sampled sparse 64-bit XOR masks (uint64[:, :])
+            rnd_bits: Pre-sampled bit indices 0-7 for short seeds (uint8[:, :])
+            num_flips: Flips to apply per row (int64[:])
+        """
+        for i in prange(out.shape[0]):
+            s = seed_idx[i]
+            base = offsets[s]
+            length = lengths[s]
+
+            for j in range(length):
+                out[i, j] = seeds_flat[base + j]
+
+            for k in range(num_flips[i]):
+                if length >= 8:
+                    wp = rnd_pos[i, k] % (length - 7)
+                    m = rnd_masks[i, k]
+                    for b in range(8):
+                        out[i, wp + b] ^= np.uint8((m >> (8 * b)) & 0xFF)
+                else:
+                    p = rnd_pos[i, k] % length
+                    out[i, p] ^= np.uint8(1) << (rnd_bits[i, k] & 7)
+
+
+# AFL++ forkserver protocol constants
+AFL_MAP_SIZE = 65536       # Coverage bitmap size (bytes)
+AFL_FORKSRV_CTL_FD = 198   # Control descriptor expected by instrumented targets
+AFL_FORKSRV_ST_FD = 199    # Status descriptor expected by instrumented targets
+
+# SysV IPC constants (not exposed by the os module)
+IPC_PRIVATE = 0
+IPC_CREAT = 0o1000
+IPC_RMID = 0
+
+
+class AFLForkServer:
+    """AFL++ forkserver/persistent-mode client
+
+    Spawns an afl-clang-fast instrumented target once and drives it over
+    the AFL++ forkserver protocol: a 4-byte "go" message on the control
+    pipe triggers one execution, and the child's wait status comes back
+    on the status pipe. With __AFL_LOOP in the target this avoids the
+    fork+exec per input that dominates plain subprocess.run fuzzing.
+
+    The coverage bitmap is shared via SysV shared memory (__AFL_SHM_ID),
+    and inputs are delivered through a file dup'd to the target's stdin,
+    rewritten in place before each execution.
+    """
+
+    def __init__(self, target: str, input_path: str):
+        """
+        Spawn the target and complete the forkserver handshake
+
+        Args:
+            target: Path to afl-instrumented harness binary
+            input_path: Scratch file used to deliver inputs via stdin
+
+        Raises:
+            OSError: Shared memory or pipe setup failed
+            RuntimeError: Target did not speak the forkserver protocol
+        """
+        self.target = target
+        self.input_path = input_path
+        self.proc = None
+        self.shm_id = -1
+        self.shm_addr = None
+        self.child_pid = -1
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.shmat.restype = ctypes.c_void_p
+        libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        self._libc = libc
+
+        # Shared memory for the 64 KB coverage bitmap
+        self.shm_id = libc.shmget(IPC_PRIVATE, AFL_MAP_SIZE, IPC_CREAT | 0o600)
+        if self.shm_id < 0:
+            raise OSError("shmget() failed for AFL coverage bitmap")
+
+        addr = libc.shmat(self.shm_id, None, 0)
+        if addr is None or addr == ctypes.c_void_p(-1).value:
+            libc.shmctl(self.shm_id, IPC_RMID, None)
+            raise OSError("shmat() failed for AFL coverage bitmap")
+        self.shm_addr = addr
+        self.bitmap = (ctypes.c_ubyte * AFL_MAP_SIZE).from_address(addr)
+
+        # Control/status pipe pair on the descriptors AFL++ expects
+        ctl_read, self._ctl_write = os.pipe()
+        self._st_read, st_write = os.pipe()
+
+        # Input scratch file, dup'd to the target's stdin
+        self._input_fd = os.open(input_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+
+        env = dict(os.environ)
+        env["__AFL_SHM_ID"] = str(self.shm_id)
+        env["AFL_MAP_SIZE"] = str(AFL_MAP_SIZE)
+        env["AFL_PERSISTENT"] = "1"
+
+        # AFL++ expects its pipe ends on fds 198/199, so put them there
+        # in the parent and let pass_fds inherit them. A preexec_fn dup2
+        # cannot do this: pass_fds forces close_fds=True, and CPython
+        # closes every fd outside pass_fds after preexec_fn runs, which
+        # would shut the freshly dup'd 198/199 again before exec.
+        os.dup2(ctl_read, AFL_FORKSRV_CTL_FD)
+        os.dup2(st_write, AFL_FORKSRV_ST_FD)
+        os.close(ctl_read)
+        os.close(st_write)
+
+        try:
+            self.proc = subprocess.Popen(
+                [target],
+                stdin=self._input_fd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=env,
+                pass_fds=(AFL_FORKSRV_CTL_FD, AFL_FORKSRV_ST_FD)
+            )
+        finally:
+            # The child owns its copies now; drop the parent's so a
+            # forkserver exit shows up as EOF on the status pipe
+            os.close(AFL_FORKSRV_CTL_FD)
+            os.close(AFL_FORKSRV_ST_FD)
+
+        # Handshake: instrumented targets send 4 bytes when ready. A
+        # short read means the target exited instead (EOF also wakes
+        # select), i.e. it does not speak the protocol.
+        hello = b""
+        if self._wait_status(5.0):
+            hello = os.read(self._st_read, 4)
+        if len(hello) != 4:
+            self.close()
+            raise RuntimeError(
+                f"{target}: no forkserver handshake "
+                f"(target not built with afl-clang-fast?)"
+            )
+
+    def _wait_status(self, timeout: float) -> bool:
+        """Wait for data on the status pipe (select-based timeout)"""
+        ready, _, _ = select.select([self._st_read], [], [], timeout)
+        return bool(ready)
+
+    def run(self, input_data: bytes, timeout: float = 1.0) -> int:
+        """
+        Execute the target once with the given input
+
+        Args:
+            input_data: Input bytes (delivered via the target's stdin)
+            timeout: Per-execution timeout in seconds
+
+        Returns:
+            Raw waitpid status of the execution (os.WIFSIGNALED to
+            detect crashes)
+
+        Raises:
+            subprocess.TimeoutExpired: Execution exceeded the timeout
+        """
+        # Rewrite the input file in place: pwrite at offset 0 plus a
+        # truncate-to-length replaces the truncate/seek/write sequence,
+        # and writes straight out of the caller's buffer (typically a
+        # memoryview into the mutation scratch - no intermediate copy).
+        # The lseek stays because the child shares this file description
+        # as its stdin and must see offset 0.
+        n = os.pwrite(self._input_fd, input_data, 0)
+        os.ftruncate(self._input_fd, n)
+        os.lseek(self._input_fd, 0, os.SEEK_SET)
+
+        # Reset coverage bitmap for this execution
+        ctypes.memset(self.shm_addr, 0, AFL_MAP_SIZE)
+
+        # Signal the forkserver to run one iteration
+        os.write(self._ctl_write, b"\x00\x00\x00\x00")
+
+        if not self._wait_status(timeout):
+            raise subprocess.TimeoutExpired(self.target, timeout)
+        data = os.read(self._st_read, 4)
+        if len(data) != 4:
+            raise RuntimeError(f"{self.target}: forkserver exited unexpectedly")
+        self.child_pid = struct.unpack("<I", data)[0]
+
+        if not self._wait_status(timeout):
+            # Hang: kill the forked child; its status arrives once reaped
+            try:
+                os.kill(self.child_pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+            if self._wait_status(timeout):
+                os.read(self._st_read, 4)
+            raise subprocess.TimeoutExpired(self.target, timeout)
+
+        data = os.read(self._st_read, 4)
+        if len(data) != 4:
+            raise RuntimeError(f"{self.target}: forkserver exited unexpectedly")
+        return struct.unpack("<I", data)[0]
+
+    def close(self):
+        """Terminate the forkserver and release IPC resources"""
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+
+        for fd in (self._ctl_write, self._st_read, self._input_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+        if self.shm_addr is not None:
+            self._libc.shmdt(ctypes.c_void_p(self.shm_addr))
+            self.shm_addr = None
+        if self.shm_id >= 0:
+            self._libc.shmctl(self.shm_id, IPC_RMID, None)
+            self.shm_id = -1
+
+
+class PipeWrapperExecutor:
+    """Persistent pipe-driven target executor
+
+    Middle tier between the AFL++ forkserver and one-shot posix_spawn:
+    a tiny shell wrapper (run_once.sh) is spawned once per worker and
+    loops reading length-prefixed inputs from stdin, running the target
+    in file mode and reporting "EXIT=<status>" on stdout. The fork+exec
+    per input still happens, but in the shell - argv construction,
+    signal-mask reset and pipe creation are amortized out of Python.
+    """
+
+    WRAPPER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "run_once.sh")
+
+    def __init__(self, target: str, input_path: str):
+        """
+        Spawn the wrapper and set up the reusable pipes
+
+        Args:
+            target: Path to fuzzing harness binary
+            input_path: Scratch file the wrapper writes each input to
+
+        Raises:
+            OSError: Wrapper script missing or could not be spawned
+        """
+        if not os.path.isfile(self.WRAPPER):
+            raise FileNotFoundError(self.WRAPPER)
+        self.target = target
+        self.input_path = input_path
+        self._err_read, self._err_write = os.pipe()
+        os.set_blocking(self._err_read, False)
+        if hasattr(fcntl, "F_SETPIPE_SZ"):
+            try:
+                fcntl.fcntl(self._err_write, fcntl.F_SETPIPE_SZ, 1 << 20)
+            except OSError:
+                pass
+        self.proc = None
+        self._spawn()
+
+    def _spawn(self):
+        """(Re)spawn the wrapper in its own process group"""
+        # A fresh session lets a timeout kill the wrapper and whatever
+        # target it is currently running with one killpg
+        self.proc = subprocess.Popen(
+            ["/bin/sh", self.WRAPPER, self.target, self.input_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._err_write,
+            bufsize=0,
+            start_new_session=True,
+        )
+        self._line_buf = b""
+
+    def run(self, input_data, timeout: float = 1.0):
+        """
+        Execute the target once with the given input
+
+        The length header and payload go out in a single writev; the
+        wrapper's EXIT marker is then awaited with a deadline.
+
+        Args:
+            input_data: Input bytes (written to the scratch file by the
+                wrapper, then passed to the target as argv[1])
+            timeout: Per-execution timeout in seconds
+
+        Returns:
+            (returncode, stderr_bytes) tuple; returncode is negative
+            for signal deaths, matching subprocess conventions
+
+        Raises:
+            subprocess.TimeoutExpired: Execution exceeded the timeout
+                (the wrapper is killed and respawned first)
+            RuntimeError: Wrapper exited or broke protocol
+        """
+        try:
+            os.writev(self.proc.stdin.fileno(),
+                      [b"%d\n" % len(input_data), input_data])
+        except (BrokenPipeError, OSError):
+            raise RuntimeError(f"{self.target}: wrapper exited unexpectedly")
+
+        stdout_fd = self.proc.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        while b"\n" not in self._line_buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._kill()
+                self._spawn()
+                self._drain_stderr()
+                raise subprocess.TimeoutExpired(self.target, timeout)
+            ready, _, _ = select.select([stdout_fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(stdout_fd, 4096)
+            if not chunk:
+                raise RuntimeError(f"{self.target}: wrapper exited unexpectedly")
+            self._line_buf += chunk
+
+        line, _, self._line_buf = self._line_buf.partition(b"\n")
+        stderr = self._drain_stderr()
+        if not line.startswith(b"EXIT="):
+            raise RuntimeError(f"{self.target}: bad wrapper reply {line!r}")
+
+        status = int(line[5:])
+        if status > 128:
+            # The shell reports signal deaths as 128+N
+            return 128 - status, stderr
+        return status, stderr
+
+    def _drain_stderr(self) -> bytes:
+        """Drain whatever the last execution wrote to stderr"""
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(self._err_read, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _kill(self):
+        """Kill the wrapper's process group and reap it"""
+        if self.proc is None:
+            return
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except (OSError, ProcessLookupError):
+            pass
+        self.proc.stdin.close()
+        self.proc.stdout.close()
+        self.proc.wait()
+        self.proc = None
+
+    def close(self):
+        """Terminate the wrapper and release the stderr pipe"""
+        self._kill()
+        for fd in (self._err_read, self._err_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class PosixSpawnExecutor:
+    """One-shot target executor built on os.posix_spawn
+
+    Fallback for targets without AFL instrumentation. posix_spawn uses
+    vfork/CLONE_VFORK under the hood, skipping the page-table copy that
+    fork() pays on every subprocess.run - significant once the parent
+    maps the seed cache and the OpenVINO runtime. One stderr pipe and
+    one stdin scratch file are reused across iterations instead of
+    re-creating the fd plumbing per execution.
+    """
+
+    def __init__(self, target: str, input_path: str):
+        """
+        Set up the reusable execution plumbing
+
+        Args:
+            target: Path to fuzzing harness binary
+            input_path: Scratch file dup'd to the target's stdin
+        """
+        self.target = target
+        self.input_path = input_path
+        self._input_fd = os.open(input_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        self._err_read, self._err_write = os.pipe()
+        os.set_blocking(self._err_read, False)
+
+        # Enlarge the stderr pipe so a target spewing sanitizer output
+        # never blocks on the default 64 KB buffer mid-execution
+        if hasattr(fcntl, "F_SETPIPE_SZ"):
+            try:
+                fcntl.fcntl(self._err_write, fcntl.F_SETPIPE_SZ, 1 << 20)
+            except OSError:
+                pass
+
+    def run(self, input_data, timeout: float = 1.0):
+        """
+        Execute the target once with the given input
+
+        Args:
+            input_data: Input bytes (delivered via the target's stdin)
+            timeout: Per-execution timeout in seconds
+
+        Returns:
+            (returncode, stderr_bytes) tuple; returncode is negative
+            for signal deaths, matching subprocess conventions
+
+        Raises:
+            subprocess.TimeoutExpired: Execution exceeded the timeout
+        """
+        n = os.pwrite(self._input_fd, input_data, 0)
+        os.ftruncate(self._input_fd, n)
+        os.lseek(self._input_fd, 0, os.SEEK_SET)
+
+        pid = os.posix_spawn(
+            self.target,
+            [self.target],
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, self._input_fd, 0),
+                (os.POSIX_SPAWN_DUP2, self._err_write, 2),
+            ]
+        )
+
+        # Poll for exit with a deadline; no SIGCHLD machinery needed
+        deadline = time.monotonic() + timeout
+        while True:
+            wpid, status = os.waitpid(pid, os.WNOHANG)
+            if wpid == pid:
+                break
+            if time.monotonic() >= deadline:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                self._drain_stderr()
+                raise subprocess.TimeoutExpired(self.target, timeout)
+            time.sleep(0.001)
+
+        stderr = self._drain_stderr()
+        if os.WIFSIGNALED(status):
+            return -os.WTERMSIG(status), stderr
+        return os.WEXITSTATUS(status), stderr
+
+    def _drain_stderr(self) -> bytes:
+        """Drain whatever the last execution wrote to stderr"""
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(self._err_read, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def close(self):
+        """Release the reusable descriptors"""
+        for fd in (self._input_fd, self._err_read, self._err_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
 class OpenVINOFuzzer:
     """Multi-device AI-guided fuzzer using OpenVINO"""
 
@@ -76,7 +625,8 @@ class OpenVINOFuzzer:
                  fuzz_target: str,
                  seed_dir: str,
                  output_dir: str,
-                 devices: Optional[List[DeviceConfig]] = None):
+                 devices: Optional[List[DeviceConfig]] = None,
+                 model_path: Optional[str] = None):
         """
         Initialize OpenVINO fuzzer
 
@@ -85,20 +635,79 @@ class OpenVINOFuzzer:
             seed_dir: Directory containing seed inputs
             output_dir: Directory for fuzzing outputs
             devices: List of devices to use (auto-detect if None)
+            model_path: Optional mutation-guidance model (OpenVINO IR)
         """
         self.fuzz_target = fuzz_target
         self.seed_dir = seed_dir
         self.output_dir = output_dir
-        self.devices = devices or self._auto_detect_devices()
 
-        # Initialize OpenVINO Core
+        # Initialize OpenVINO Core before device auto-detection, which
+        # queries it for available devices. This handle serves only the
+        # parent process (detection, reporting) - workers build their
+        # own post-fork.
         self.core = Core() if HAVE_OPENVINO else None
+        self.devices = devices or self._auto_detect_devices()
 
-        # Fuzzing state
-        self.fuzzing_threads = []
-        self.stats = defaultdict(FuzzingStats)
+        # Mutation-guidance model. Only the path is resolved here: the
+        # model itself is compiled lazily inside each worker process
+        # (see _ensure_infer_queue), since OpenVINO's runtime is not
+        # fork-safe and the workers are forked in start().
+        #
+        # An int8-quantized sibling IR (<stem>_int8.xml, produced offline
+        # with OpenVINO POT DefaultQuantization) is preferred when
+        # present: int8 moves a quarter of the fp32 bytes and doubles
+        # CPU ALU throughput via VNNI, keeping inference latency well
+        # below the target's exec time.
+        self.model_path = model_path
+        if model_path:
+            p = Path(model_path)
+            int8_path = p.with_name(f"{p.stem}_int8{p.suffix}")
+            if int8_path.exists():
+                print(f"Using int8 quantized guidance model: {int8_path}")
+                self.model_path = str(int8_path)
+            elif not p.exists():
+                print(f"Warning: guidance model not found: {model_path}")
+                self.model_path = None
+        self.compiled = {}
+        self.infer_queues = {}
+
+        # Fuzzing state. Workers run as separate processes: the mutators
+        # are CPU-bound Python/NumPy work that would serialize on the GIL
+        # as threads. Stats live in one shared-memory block of int64
+        # counters, one row per worker (see STAT_* above).
+        self.fuzzing_workers = []
+        self.worker_names = []
+        self._display_names = []
         self.running = False
         self.start_time = 0
+        self._mp_ctx = multiprocessing.get_context("fork")
+        self._stop_event = self._mp_ctx.Event()
+        self._stats_shm = None
+        self._stats_view = None
+        self._stats_arr = None
+
+        # Seed corpus, loaded once: the mutators draw from these caches
+        # instead of re-globbing and re-reading unchanged files on every
+        # batch, which saturates the VFS layer on many-worker runs
+        seed_files = sorted(Path(seed_dir).glob("*.bin"))
+        if not seed_files:
+            print(f"Warning: No seed files found in {seed_dir}")
+        self._seed_blobs = [f.read_bytes() for f in seed_files]
+
+        # Flattened seed buffer for the Numba mutation kernel
+        # (built lazily on first use)
+        self._seed_pack_cache = None
+
+        # Per-worker mutation scratch (mutable seed copies, batch buffer)
+        self._tls = threading.local()
+
+        # Seeds that already received their deterministic pass (indices
+        # into the seed cache, tracked per worker after the fork). The
+        # partition is set by each worker so a device's instances split
+        # the seeds between them instead of all replaying the identical
+        # deterministic inputs.
+        self._det_done_seeds = set()
+        self._det_partition = (0, 1)
 
         # Create output directories
         Path(output_dir).mkdir(parents=True, exist_ok=True)
@@ -157,132 +766,585 @@ class OpenVINOFuzzer:
 
         return devices
 
-    def _generate_ai_inputs(self, device: DeviceConfig, count: int = 100) -> List[bytes]:
+    @staticmethod
+    def _precision_config(device: DeviceConfig) -> Dict[str, str]:
         """
-        Generate AI-guided fuzzing inputs using OpenVINO
+        Per-device compile properties for the guidance model
 
-        Uses neural network to mutate seed inputs based on coverage feedback.
-        Falls back to random mutation if OpenVINO unavailable.
+        GPUs run the model in f16 (half the memory traffic of f32 with
+        no accuracy cost for a scoring head); the VPU gets its SHAVE
+        core count pinned. Quantized int8 IRs need no precision hint -
+        their FakeQuantize ops select the VNNI int8 kernels on CPU by
+        themselves.
 
         Args:
-            device: Device configuration for inference
-            count: Number of inputs to generate
+            device: Device the model is being compiled for
 
         Returns:
-            List of generated input bytes
+            Property dict merged into the THROUGHPUT baseline
         """
-        inputs = []
+        if device.device_id.startswith("GPU"):
+            return {"INFERENCE_PRECISION_HINT": "f16"}
+        if device.device_id in ("MYRIAD", "HDDL"):
+            return {"VPU_NUMBER_OF_SHAVES": "10"}
+        return {}
 
-        # Load seed inputs
-        seed_files = list(Path(self.seed_dir).glob("*.bin"))
-        if not seed_files:
-            print(f"Warning: No seed files found in {self.seed_dir}")
-            return inputs
+    def _seed_pack(self):
+        """
+        Flatten the cached seed corpus into one contiguous uint8 buffer
 
-        if HAVE_OPENVINO and HAVE_NUMPY:
-            # AI-guided mutation (simplified - would use trained model)
-            for _ in range(count):
-                seed_file = np.random.choice(seed_files)
-                seed_data = seed_file.read_bytes()
+        Builds (and caches) the concatenated seed bytes plus per-seed
+        offset/length arrays consumed by the _batch_bitflip kernel.
+        Empty seeds are skipped since there is nothing to flip.
+
+        Returns:
+            (seeds_flat, offsets, lengths) tuple of NumPy arrays, or
+            None if no non-empty seeds exist
+        """
+        if self._seed_pack_cache is None:
+            blobs = [b for b in self._seed_blobs if b]
+            if not blobs:
+                return None
 
-                # Simple mutation strategy (would be replaced with ML model)
-                mutated = bytearray(seed_data)
+            lengths = np.array([len(b) for b in blobs], dtype=np.int64)
+            offsets = np.zeros(len(blobs), dtype=np.int64)
+            offsets[1:] = np.cumsum(lengths)[:-1]
+            seeds_flat = np.frombuffer(b"".join(blobs), dtype=np.uint8)
 
-                # Random bit flips
-                num_flips = np.random.randint(1, 10)
-                for _ in range(num_flips):
-                    if len(mutated) > 0:
-                        byte_idx = np.random.randint(0, len(mutated))
-                        bit_idx = np.random.randint(0, 8)
-                        mutated[byte_idx] ^= (1 << bit_idx)
+            self._seed_pack_cache = (seeds_flat, offsets, lengths)
 
-                inputs.append(bytes(mutated))
+        return self._seed_pack_cache
+
+    def _worker_scratch(self):
+        """
+        Per-worker mutation scratch, created lazily on first use
+
+        Holds mutable copies of the seed corpus plus the reusable Numba
+        batch buffer. Stored thread-locally so workers never contend on
+        or corrupt each other's in-flight buffers.
+        """
+        tls = self._tls
+        if not hasattr(tls, "seed_bufs"):
+            tls.seed_bufs = [bytearray(b) for b in self._seed_blobs]
+            tls.seed_views = ([np.frombuffer(b, dtype=np.uint8) for b in tls.seed_bufs]
+                              if HAVE_NUMPY else [])
+            tls.batch_out = None
+            tls.infer_in = None
+            tls.score_out = None
+        return tls
+
+    def _ensure_infer_queue(self, device: DeviceConfig):
+        """
+        Compile the guidance model for this process on first use
+
+        OpenVINO's runtime (and its TBB thread pool) is not fork-safe:
+        handles compiled in the parent would hang or crash in forked
+        workers, so each worker builds its own Core, compiled model and
+        AsyncInferQueue the first time it scores a batch. The result is
+        cached per device name - None when the model would not compile,
+        so the attempt is made only once. The THROUGHPUT hint sizes the
+        plugin's optimal request pool and AsyncInferQueue defaults to
+        that size.
+
+        Args:
+            device: Device to compile the model for
+
+        Returns:
+            The device's AsyncInferQueue, or None without a usable model
+        """
+        if device.name in self.infer_queues:
+            return self.infer_queues[device.name]
+
+        queue = None
+        if HAVE_OPENVINO and self.model_path and os.path.exists(self.model_path):
+            config = {"PERFORMANCE_HINT": "THROUGHPUT"}
+            config.update(self._precision_config(device))
+            try:
+                core = Core()
+                model = core.read_model(self.model_path)
+                try:
+                    compiled = core.compile_model(model, device.device_id, config)
+                except Exception:
+                    # Precision/VPU properties vary by plugin version;
+                    # retry with the baseline config before giving up
+                    compiled = core.compile_model(
+                        model, device.device_id,
+                        {"PERFORMANCE_HINT": "THROUGHPUT"}
+                    )
+                self.compiled[device.name] = compiled
+                queue = AsyncInferQueue(compiled)
+            except Exception as e:
+                print(f"Warning: guidance model not compiled for {device.name}: {e}")
+
+        self.infer_queues[device.name] = queue
+        return queue
+
+    def _score_batch(self, device: DeviceConfig, batch) -> Optional["np.ndarray"]:
+        """
+        Score a mutated batch with the guidance model
+
+        Issues one async request per row through this process's
+        AsyncInferQueue - the pool of InferRequest objects is built once
+        per worker (see _ensure_infer_queue), so no tensor or request
+        setup happens per call. The whole batch is staged into one
+        reusable float16 tensor (half the bytes of f32 through the
+        device) and scores land in a preallocated output buffer.
+        Returns None when no model is loaded for the device.
+
+        Args:
+            device: Device whose inference queue to use
+            batch: uint8 batch of mutated inputs (count x max_len)
+
+        Returns:
+            float32 score per row (view into per-worker scratch, valid
+            until the next call), or None
+        """
+        queue = self._ensure_infer_queue(device)
+        if queue is None:
+            return None
+
+        count, width = batch.shape
+
+        # Reusable per-worker staging/output buffers, grown on demand
+        tls = self._worker_scratch()
+        if (tls.infer_in is None
+                or tls.infer_in.shape[0] < count
+                or tls.infer_in.shape[1] < width):
+            tls.infer_in = np.empty((count, width), dtype=np.float16)
+            tls.score_out = np.empty(count, dtype=np.float32)
+
+        x = tls.infer_in[:count, :width]
+        np.copyto(x, batch, casting="unsafe")
+        scores = tls.score_out[:count]
+        scores.fill(0.0)
+
+        def _on_done(request, idx):
+            output = next(iter(request.results.values()))
+            scores[idx] = float(np.asarray(output).reshape(-1)[0])
+
+        queue.set_callback(_on_done)
+        for i in range(count):
+            queue.start_async({0: x[i:i + 1]}, userdata=i)
+        queue.wait_all()
+
+        return scores
+
+    # AFL's interesting byte values: boundary cases that flush out
+    # off-by-one, sign and truncation bugs
+    _INTERESTING_BYTES = (0x00, 0x01, 0x7F, 0x80, 0xFF)
+
+    def _deterministic_stage(self, buf: bytearray) -> Iterator[memoryview]:
+        """
+        Exhaustive deterministic mutations of one seed copy
+
+        Walks the seed sequentially: every single-bit flip first, then
+        every interesting-value byte overwrite - O(len) executions that
+        empirically find far more crashes per iteration than stacked
+        random havoc. Mutations are applied in place and reverted after
+        each yield, same contract as the havoc paths.
+
+        Args:
+            buf: Mutable per-worker seed copy
+
+        Yields:
+            memoryview of each mutated input (valid until the next one)
+        """
+        mv = memoryview(buf)
+
+        for bit in range(8 * len(buf)):
+            idx = bit >> 3
+            mask = 1 << (bit & 7)
+            buf[idx] ^= mask
+            yield mv
+            buf[idx] ^= mask
+
+        for idx in range(len(buf)):
+            old = buf[idx]
+            for val in self._INTERESTING_BYTES:
+                if val == old:
+                    continue
+                buf[idx] = val
+                yield mv
+            buf[idx] = old
+
+    def _generate_ai_inputs(self, device: DeviceConfig, count: int = 100,
+                            rng=None) -> Iterator[memoryview]:
+        """
+        Generate AI-guided fuzzing inputs using OpenVINO
+
+        Each seed first gets one exhaustive deterministic pass (see
+        _deterministic_stage); after that, vectorized havoc mutations,
+        ordered by the guidance model when one is loaded. Falls back to
+        pure-Python random mutation only when NumPy is unavailable.
+
+        Mutations are applied in place to per-worker seed copies and
+        reverted between iterations, so no allocation or memcpy happens
+        per input. Each yielded view is only valid until the next input
+        is drawn; callers must copy it (bytes(mv)) to keep it.
+
+        Args:
+            device: Device configuration for inference
+            count: Number of inputs to generate
+            rng: Per-worker np.random.Generator (a fresh one is created
+                 when omitted)
+
+        Yields:
+            memoryview of each mutated input
+        """
+        if not self._seed_blobs:
+            return
+
+        # Deterministic stage: a fresh seed gets one exhaustive pass of
+        # sequential bit flips and interesting-byte overwrites before it
+        # enters the random havoc rotation. Seed indices are partitioned
+        # across a device's workers (si mod instances == instance_id) so
+        # the corpus gets exactly one deterministic pass globally, not
+        # one per worker. The pass ignores count - it runs until the
+        # seed is exhausted, then later calls fall through to havoc.
+        det_idx, det_mod = self._det_partition
+        seed_bufs = self._worker_scratch().seed_bufs
+        for si, buf in enumerate(seed_bufs):
+            if si % det_mod != det_idx or si in self._det_done_seeds or not buf:
+                continue
+            self._det_done_seeds.add(si)
+            yield from self._deterministic_stage(buf)
+            return
+
+        # The vectorized havoc paths need only NumPy - model scoring is
+        # an optional layer on top, not a prerequisite for fast mutation
+        if HAVE_NUMPY:
+            if rng is None:
+                rng = np.random.default_rng()
+            max_flips = 9
+            num_flips = rng.integers(1, max_flips + 1, size=count)
+
+            pack = self._seed_pack() if HAVE_NUMBA else None
+            if pack is not None:
+                # Compiled path: one parallel kernel call mutates the
+                # whole batch out of the flattened seed buffer
+                seeds_flat, offsets, lengths = pack
+                seed_idx = rng.integers(0, offsets.size, size=count)
+                rnd_pos = rng.integers(0, np.iinfo(np.int64).max, size=(count, max_flips))
+                rnd_masks = _sparse_masks(rng, (count, max_flips))
+                rnd_bits = rng.integers(0, 8, size=(count, max_flips), dtype=np.uint8)
+
+                tls = self._worker_scratch()
+                max_len = int(lengths.max())
+                if (tls.batch_out is None
+                        or tls.batch_out.shape[0] < count
+                        or tls.batch_out.shape[1] < max_len):
+                    tls.batch_out = np.empty((count, max_len), dtype=np.uint8)
+
+                out = tls.batch_out[:count, :max_len]
+                _batch_bitflip(seeds_flat, offsets, lengths, seed_idx, out,
+                               rnd_pos, rnd_masks, rnd_bits, num_flips)
+
+                # With a guidance model loaded, execute the most promising
+                # mutations first (batch rows stay valid for the whole call)
+                order = range(count)
+                scores = self._score_batch(device, out)
+                if scores is not None:
+                    order = np.argsort(scores)[::-1]
+
+                for i in order:
+                    yield memoryview(out[i, :lengths[seed_idx[i]]])
+
+                return
+
+            # Pre-sample flip counts, positions and XOR masks for the whole
+            # batch in a few RNG calls instead of 2-3 calls per flip.
+            # Positions are sampled as uniform floats and scaled per seed,
+            # since seed lengths vary.
+            flip_pos = rng.random((count, max_flips))
+            flip_masks = _sparse_masks(rng, (count, max_flips))
+            flip_bits = (1 << rng.integers(0, 8, size=(count, max_flips))).astype(np.uint8)
+
+            seed_views = self._worker_scratch().seed_views
+            for i in range(count):
+                arr = seed_views[rng.integers(0, len(seed_views))]
+
+                if arr.size == 0:
+                    yield memoryview(b"")
+                    continue
+
+                n = num_flips[i]
+
+                # SWAR havoc: reinterpret the seed copy as 64-bit words and
+                # XOR one sparse mask per flip, hitting a whole 8-byte
+                # cluster per store. XOR is its own inverse, so repeating
+                # the operation after the yield restores the seed without
+                # a log. Seeds shorter than a word keep single-bit flips.
+                if arr.size >= 8:
+                    words = arr[:arr.size & ~7].view(np.uint64)
+                    idx = (flip_pos[i, :n] * words.size).astype(np.intp)
+                    masks = flip_masks[i, :n]
+                    np.bitwise_xor.at(words, idx, masks)
+                    yield memoryview(arr)
+                    np.bitwise_xor.at(words, idx, masks)
+                else:
+                    idx = (flip_pos[i, :n] * arr.size).astype(np.intp)
+                    bits = flip_bits[i, :n]
+                    np.bitwise_xor.at(arr, idx, bits)
+                    yield memoryview(arr)
+                    np.bitwise_xor.at(arr, idx, bits)
         else:
             # Fallback: Simple random mutation
             import random
+            seed_bufs = self._worker_scratch().seed_bufs
+            revert = []
+
             for _ in range(count):
-                seed_file = random.choice(seed_files)
-                seed_data = seed_file.read_bytes()
+                buf = random.choice(seed_bufs)
+
+                if not buf:
+                    yield memoryview(b"")
+                    continue
 
-                mutated = bytearray(seed_data)
+                # Overwrite in place, recording (idx, old_byte) so the
+                # seed copy can be restored after the yield
+                del revert[:]
                 num_mutations = random.randint(1, 5)
                 for _ in range(num_mutations):
-                    if len(mutated) > 0:
-                        idx = random.randint(0, len(mutated) - 1)
-                        mutated[idx] = random.randint(0, 255)
+                    idx = random.randint(0, len(buf) - 1)
+                    revert.append((idx, buf[idx]))
+                    buf[idx] = random.randint(0, 255)
 
-                inputs.append(bytes(mutated))
+                yield memoryview(buf)
 
-        return inputs
+                for idx, old in reversed(revert):
+                    buf[idx] = old
 
-    def _fuzz_worker(self, device: DeviceConfig, instance_id: int):
+    def _fuzz_worker(self, device: DeviceConfig, instance_id: int,
+                     cpu: Optional[int], stats_idx: int):
         """
-        Fuzzing worker thread for a specific device instance
+        Fuzzing worker process for a specific device instance
 
         Args:
             device: Device configuration
             instance_id: Instance number for this worker
+            cpu: CPU to pin this worker to (no pinning if None)
+            stats_idx: Row of this worker in the shared stats block
         """
+        # Drop the parent's inherited signal handlers: a terminal Ctrl-C
+        # signals the whole foreground process group, and the parent's
+        # handler calls stop() - running that in every worker at once
+        # would tear down shared state concurrently. Shutdown is driven
+        # solely by the parent through _stop_event. SIGTERM stays at its
+        # default action so stop()'s terminate() fallback still works.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
         worker_name = f"{device.name}_{instance_id}"
-        stats = self.stats[worker_name]
-        stats.device = device.name
+        stats_view = self._stats_view
+        stats_base = stats_idx * STAT_FIELDS
+        crashes = 0
+        hangs = 0
+
+        # This worker's share of the deterministic stage (see
+        # _generate_ai_inputs): each of the device's instances takes
+        # every num_instances-th seed
+        self._det_partition = (instance_id, max(device.num_instances, 1))
+
+        # One PCG64 generator per worker: constructed once instead of per
+        # batch, seeded uniquely, and never touching the locked legacy
+        # np.random global state
+        rng = None
+        if HAVE_NUMPY:
+            rng = np.random.default_rng(seed=(os.getpid() << 16) | instance_id)
+
+        # Pin the worker to one CPU so the scheduler doesn't migrate it
+        # and flush its cache working set; the pin happens before the
+        # forkserver is spawned so the target inherits it
+        if cpu is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, {cpu})
+            except OSError as e:
+                print(f"{worker_name}: CPU pinning failed ({e})")
 
         iteration = 0
-        last_report = time.time()
 
-        while self.running:
-            # Generate AI-guided inputs
-            inputs = self._generate_ai_inputs(device, count=10)
-
-            for input_data in inputs:
-                if not self.running:
+        # Exec/sec is tracked as an exponential moving average of the
+        # per-iteration latency in integer nanoseconds: one add and one
+        # shift per iteration, no wall-clock reads and no FP division
+        # in the hot path
+        ema_ns = 0
+        last_ns = time.perf_counter_ns()
+
+        # Precompute output path prefixes once; minting a finding path is
+        # then a single string concat instead of rebuilding Path objects
+        # (flavour parsing, _str caching) inside the hot loop
+        device_dir = os.path.join(self.output_dir, device.name)
+        crash_base = os.path.join(device_dir, "crashes", f"crash_{worker_name}_")
+        hang_base = os.path.join(device_dir, "hangs", f"hang_{worker_name}_")
+
+        # Crash/hang dedup: noisy targets hit the same bug thousands of
+        # times, so findings are only written when their (input, status)
+        # hash is new to this worker. Crash details go to one append-only
+        # crashes.jsonl, buffered 64 entries at a time, instead of one
+        # .log file per crash.
+        crash_hashes = set()
+        hang_hashes = set()
+        crash_log_path = os.path.join(device_dir, "crashes.jsonl")
+        crash_log_buf = []
+
+        def flush_crash_log():
+            if crash_log_buf:
+                with open(crash_log_path, "a") as lf:
+                    lf.write("\n".join(crash_log_buf) + "\n")
+                del crash_log_buf[:]
+
+        # Try persistent/forkserver mode first: the target is spawned once
+        # and fed inputs over the AFL++ protocol, avoiding a fork+exec per
+        # execution. Fall back to one subprocess per input if the target
+        # is not instrumented. The scratch file lives on tmpfs so input
+        # delivery never touches the disk.
+        shm_dir = Path("/dev/shm") if os.path.isdir("/dev/shm") else Path(self.output_dir) / device.name
+        input_file = shm_dir / f"dsv4l2_{worker_name}.bin"
+        forkserver = None
+        executor = None
+        try:
+            forkserver = AFLForkServer(self.fuzz_target, str(input_file))
+        except (OSError, RuntimeError) as e:
+            print(f"{worker_name}: persistent mode unavailable ({e}), "
+                  f"falling back to pipe wrapper")
+            try:
+                executor = PipeWrapperExecutor(self.fuzz_target, str(input_file))
+            except OSError as e2:
+                print(f"{worker_name}: pipe wrapper unavailable ({e2}), "
+                      f"falling back to posix_spawn")
+                executor = PosixSpawnExecutor(self.fuzz_target, str(input_file))
+
+        # Coverage accounting (forkserver mode only): the 64 KB trace
+        # bitmap is viewed as 8192 uint64 words and diffed against a
+        # per-worker virgin map after each exec - new = trace & ~virgin,
+        # then virgin |= trace, AFL's has_new_bits. NumPy dispatches the
+        # bitwise passes as SIMD loops, so the diff costs microseconds;
+        # the not/and scratch buffers avoid per-exec allocation.
+        trace_words = None
+        virgin_map = cov_inv = cov_new = None
+        coverage_edges = 0
+        if forkserver is not None and HAVE_NUMPY:
+            trace_words = np.frombuffer(forkserver.bitmap, dtype=np.uint64)
+            virgin_map = np.zeros(trace_words.size, dtype=np.uint64)
+            cov_inv = np.empty_like(virgin_map)
+            cov_new = np.empty_like(virgin_map)
+
+        while not self._stop_event.is_set():
+            # Generate AI-guided inputs (views into per-worker scratch
+            # buffers, valid until the next input is drawn)
+            for input_data in self._generate_ai_inputs(device, count=10, rng=rng):
+                if self._stop_event.is_set():
                     break
 
-                # Write input to temp file
-                input_file = Path(self.output_dir) / device.name / f"input_{worker_name}_{iteration}.bin"
-                input_file.write_bytes(input_data)
-
                 # Execute fuzzing target
                 try:
-                    result = subprocess.run(
-                        [self.fuzz_target, str(input_file)],
-                        capture_output=True,
-                        timeout=1.0,
-                        text=True
-                    )
+                    if forkserver is not None:
+                        status = forkserver.run(input_data, timeout=1.0)
+                        # Signal deaths and nonzero exits both count:
+                        # an uninstrumented-path abort still exits 1
+                        crashed = os.WIFSIGNALED(status) or (
+                            os.WIFEXITED(status) and os.WEXITSTATUS(status) != 0)
+                        exec_status = status
+                        crash_info = f"Wait status: {status}"
+
+                        if trace_words is not None:
+                            np.bitwise_not(virgin_map, out=cov_inv)
+                            np.bitwise_and(trace_words, cov_inv, out=cov_new)
+                            new_words = int(np.count_nonzero(cov_new))
+                            if new_words:
+                                virgin_map |= trace_words
+                                coverage_edges += new_words
+                                stats_view[stats_base + STAT_EDGES] = coverage_edges
+                    else:
+                        returncode, stderr = executor.run(input_data, timeout=1.0)
+                        crashed = returncode != 0
+                        exec_status = returncode
+                        crash_info = (f"Return code: {returncode}\n"
+                                      f"{stderr.decode(errors='replace')}")
 
                     iteration += 1
-                    stats.iterations = iteration
-
-                    # Check for crashes
-                    if result.returncode != 0:
-                        crash_file = Path(self.output_dir) / device.name / "crashes" / f"crash_{worker_name}_{iteration}.bin"
-                        crash_file.write_bytes(input_data)
-
-                        # Write crash log
-                        crash_log = crash_file.with_suffix(".log")
-                        crash_log.write_text(f"Return code: {result.returncode}\n{result.stderr}")
-
-                        stats.unique_crashes += 1
-
-                    # Clean up temp input
-                    input_file.unlink(missing_ok=True)
+                    stats_view[stats_base + STAT_ITER] = iteration
+
+                    # Check for crashes (deduplicated by input+status hash)
+                    if crashed:
+                        h = _input_hash(input_data) ^ exec_status
+                        if h not in crash_hashes:
+                            crash_hashes.add(h)
+
+                            crash_path = f"{crash_base}{iteration}.bin"
+                            with open(crash_path, "wb") as cf:
+                                cf.write(input_data)
+
+                            crash_log_buf.append(json.dumps({
+                                "file": crash_path,
+                                "hash": f"{h & 0xFFFFFFFFFFFFFFFF:016x}",
+                                "worker": worker_name,
+                                "iteration": iteration,
+                                "info": crash_info,
+                            }))
+                            if len(crash_log_buf) >= 64:
+                                flush_crash_log()
+
+                            crashes += 1
+                            stats_view[stats_base + STAT_CRASHES] = crashes
 
                 except subprocess.TimeoutExpired:
-                    # Hang detected
-                    hang_file = Path(self.output_dir) / device.name / "hangs" / f"hang_{worker_name}_{iteration}.bin"
-                    hang_file.write_bytes(input_data)
-                    stats.unique_hangs += 1
+                    # Hang detected (deduplicated by input hash)
+                    h = _input_hash(input_data)
+                    if h not in hang_hashes:
+                        hang_hashes.add(h)
+                        with open(f"{hang_base}{iteration}.bin", "wb") as hf:
+                            hf.write(input_data)
+                        hangs += 1
+                        stats_view[stats_base + STAT_HANGS] = hangs
 
                 except Exception as e:
                     print(f"Error in {worker_name}: {e}")
 
-            # Update exec/sec metric
-            now = time.time()
-            if now - last_report >= 1.0:
-                elapsed = now - last_report
-                stats.execs_per_sec = len(inputs) / elapsed
-                last_report = now
+                    # Drop a dead forkserver or wrapper and continue one
+                    # tier down the execution strategy
+                    if forkserver is not None and forkserver.proc.poll() is not None:
+                        print(f"{worker_name}: forkserver exited, "
+                              f"falling back to pipe wrapper")
+                        # Drop the bitmap view before close() detaches
+                        # the shared segment under it
+                        trace_words = None
+                        forkserver.close()
+                        forkserver = None
+                        try:
+                            executor = PipeWrapperExecutor(self.fuzz_target,
+                                                           str(input_file))
+                        except OSError:
+                            executor = PosixSpawnExecutor(self.fuzz_target,
+                                                          str(input_file))
+                    elif (isinstance(executor, PipeWrapperExecutor)
+                            and (executor.proc is None
+                                 or executor.proc.poll() is not None)):
+                        print(f"{worker_name}: pipe wrapper exited, "
+                              f"falling back to posix_spawn")
+                        executor.close()
+                        executor = PosixSpawnExecutor(self.fuzz_target,
+                                                      str(input_file))
+
+                # Fold this iteration's latency into the EMA (alpha=1/16)
+                now_ns = time.perf_counter_ns()
+                dt = now_ns - last_ns
+                last_ns = now_ns
+                ema_ns = dt if ema_ns == 0 else (ema_ns * 15 + dt) >> 4
+
+                # Publish execs/sec every 16th iteration; the x100 fixed
+                # point folds into the division so it stays integer-only
+                if iteration & 0xF == 0:
+                    stats_view[stats_base + STAT_EPS_X100] = 100_000_000_000 // max(ema_ns, 1)
+
+        flush_crash_log()
+
+        if forkserver is not None:
+            trace_words = None
+            forkserver.close()
+        if executor is not None:
+            executor.close()
+        input_file.unlink(missing_ok=True)
 
     def start(self):
         """Start distributed fuzzing across all devices"""
@@ -296,20 +1358,50 @@ class OpenVINOFuzzer:
         print()
 
         self.running = True
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._stop_event.clear()
+
+        # Enumerate workers up front, assigning CPUs round-robin from
+        # the set this process is allowed to run on
+        cpu_pool = None
+        if hasattr(os, "sched_getaffinity"):
+            cpu_pool = deque(sorted(os.sched_getaffinity(0)))
 
-        # Launch fuzzing workers
+        assignments = []
         for device in self.devices:
             for i in range(device.num_instances):
-                thread = threading.Thread(
-                    target=self._fuzz_worker,
-                    args=(device, i),
-                    daemon=True
-                )
-                thread.start()
-                self.fuzzing_threads.append(thread)
-
-        print(f"Started {len(self.fuzzing_threads)} fuzzing workers")
+                cpu = None
+                if cpu_pool:
+                    cpu = cpu_pool[0]
+                    cpu_pool.rotate(-1)
+                assignments.append((device, i, cpu))
+
+        self.worker_names = [f"{d.name}_{i}" for d, i, _ in assignments]
+
+        # Display order, sorted once instead of per monitor refresh
+        self._display_names = sorted(self.worker_names)
+
+        # Shared stats block, inherited by the forked workers
+        self._stats_shm = shared_memory.SharedMemory(
+            create=True, size=len(assignments) * STAT_FIELDS * 8)
+        self._stats_view = memoryview(self._stats_shm.buf).cast("q")
+        for i in range(len(self._stats_view)):
+            self._stats_view[i] = 0
+        if HAVE_NUMPY:
+            self._stats_arr = np.ndarray(
+                (len(assignments),), dtype=STATS_DTYPE, buffer=self._stats_shm.buf)
+
+        # Launch one worker process per instance
+        for stats_idx, (device, i, cpu) in enumerate(assignments):
+            proc = self._mp_ctx.Process(
+                target=self._fuzz_worker,
+                args=(device, i, cpu, stats_idx),
+                daemon=True
+            )
+            proc.start()
+            self.fuzzing_workers.append(proc)
+
+        print(f"Started {len(self.fuzzing_workers)} fuzzing workers")
         print()
 
         # Monitor fuzzing progress
@@ -319,12 +1411,50 @@ class OpenVINOFuzzer:
         """Stop all fuzzing workers"""
         print("\nStopping fuzzing workers...")
         self.running = False
+        self._stop_event.set()
 
-        for thread in self.fuzzing_threads:
-            thread.join(timeout=2.0)
+        for proc in self.fuzzing_workers:
+            proc.join(timeout=2.0)
+            if proc.is_alive():
+                proc.terminate()
 
         self._print_final_stats()
 
+        # Release the shared stats block (the ndarray view must go first
+        # or close() fails with live buffer exports). The unlink is
+        # idempotent so racing shutdown paths don't trip over a segment
+        # that is already gone.
+        if self._stats_shm is not None:
+            self._stats_arr = None
+            self._stats_view.release()
+            self._stats_view = None
+            self._stats_shm.close()
+            try:
+                self._stats_shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._stats_shm = None
+
+    def _stats_snapshot(self) -> Dict[str, FuzzingStats]:
+        """Read the shared stats block into per-worker FuzzingStats views"""
+        snapshot = {}
+        view = self._stats_view
+        if view is None:
+            return snapshot
+
+        for idx, name in enumerate(self.worker_names):
+            base = idx * STAT_FIELDS
+            snapshot[name] = FuzzingStats(
+                device=name.rsplit("_", 1)[0],
+                iterations=view[base + STAT_ITER],
+                execs_per_sec=view[base + STAT_EPS_X100] / 100.0,
+                unique_crashes=view[base + STAT_CRASHES],
+                unique_hangs=view[base + STAT_HANGS],
+                coverage_edges=view[base + STAT_EDGES]
+            )
+
+        return snapshot
+
     def _monitor_loop(self):
         """Monitor and display fuzzing progress"""
         try:
@@ -336,39 +1466,60 @@ class OpenVINOFuzzer:
 
     def _print_stats(self):
         """Print real-time fuzzing statistics"""
-        os.system('clear' if os.name != 'nt' else 'cls')
-
-        print("=" * 80)
-        print("DSV4L2 Distributed Fuzzing - Live Statistics")
-        print("=" * 80)
-
-        runtime = time.time() - self.start_time
+        runtime = time.monotonic() - self.start_time
         hours = int(runtime // 3600)
         minutes = int((runtime % 3600) // 60)
         seconds = int(runtime % 60)
 
-        print(f"Runtime: {hours:02d}:{minutes:02d}:{seconds:02d}")
-        print()
-
-        # Aggregate stats
-        total_iters = sum(s.iterations for s in self.stats.values())
-        total_crashes = sum(s.unique_crashes for s in self.stats.values())
-        total_hangs = sum(s.unique_hangs for s in self.stats.values())
-        total_execs_per_sec = sum(s.execs_per_sec for s in self.stats.values())
-
-        print(f"Total Iterations: {total_iters:,}")
-        print(f"Exec Speed: {total_execs_per_sec:.1f} execs/sec")
-        print(f"Unique Crashes: {total_crashes}")
-        print(f"Unique Hangs: {total_hangs}")
-        print()
-
-        # Per-device stats
-        print(f"{'Worker':<20} {'Iterations':<12} {'Execs/sec':<12} {'Crashes':<10} {'Hangs':<10}")
-        print("-" * 80)
-
-        for worker_name, stats in sorted(self.stats.items()):
-            print(f"{worker_name:<20} {stats.iterations:<12,} {stats.execs_per_sec:<12.1f} "
-                  f"{stats.unique_crashes:<10} {stats.unique_hangs:<10}")
+        # Aggregate stats: one vectorized reduction per column when the
+        # structured view is available
+        worker_stats = self._stats_snapshot()
+        if self._stats_arr is not None:
+            total_iters = int(self._stats_arr['iter'].sum())
+            total_crashes = int(self._stats_arr['crash'].sum())
+            total_hangs = int(self._stats_arr['hang'].sum())
+            total_execs_per_sec = self._stats_arr['eps_x100'].sum() / 100.0
+            total_edges = int(self._stats_arr['edges'].sum())
+        else:
+            total_iters = sum(s.iterations for s in worker_stats.values())
+            total_crashes = sum(s.unique_crashes for s in worker_stats.values())
+            total_hangs = sum(s.unique_hangs for s in worker_stats.values())
+            total_execs_per_sec = sum(s.execs_per_sec for s in worker_stats.values())
+            total_edges = sum(s.coverage_edges for s in worker_stats.values())
+
+        rows = [
+            "=" * 80,
+            "DSV4L2 Distributed Fuzzing - Live Statistics",
+            "=" * 80,
+            f"Runtime: {hours:02d}:{minutes:02d}:{seconds:02d}",
+            "",
+            f"Total Iterations: {total_iters:,}",
+            f"Exec Speed: {total_execs_per_sec:.1f} execs/sec",
+            f"Unique Crashes: {total_crashes}",
+            f"Unique Hangs: {total_hangs}",
+            f"Coverage Edges: {total_edges:,}",
+            "",
+            f"{'Worker':<20} {'Iterations':<12} {'Execs/sec':<12} {'Crashes':<10} "
+            f"{'Hangs':<10} {'Edges':<10}",
+            "-" * 80,
+        ]
+
+        # Per-device stats (display order pre-sorted in start()). The
+        # snapshot is empty once stop() has released the stats block, so
+        # a final monitor refresh racing shutdown just prints the header.
+        for worker_name in self._display_names:
+            stats = worker_stats.get(worker_name)
+            if stats is None:
+                continue
+            rows.append(
+                f"{worker_name:<20} {stats.iterations:<12,} {stats.execs_per_sec:<12.1f} "
+                f"{stats.unique_crashes:<10} {stats.unique_hangs:<10} "
+                f"{stats.coverage_edges:<10}")
+
+        # One write: ANSI home + erase-below, then the whole frame. No
+        # fork+exec of /usr/bin/clear and no flicker from a full redraw.
+        sys.stdout.write("\x1b[H\x1b[J" + "\n".join(rows) + "\n")
+        sys.stdout.flush()
 
     def _print_final_stats(self):
         """Print final fuzzing statistics"""
@@ -377,17 +1528,27 @@ class OpenVINOFuzzer:
         print("Final Fuzzing Statistics")
         print("=" * 80)
 
-        runtime = time.time() - self.start_time
+        runtime = time.monotonic() - self.start_time
 
-        total_iters = sum(s.iterations for s in self.stats.values())
-        total_crashes = sum(s.unique_crashes for s in self.stats.values())
-        total_hangs = sum(s.unique_hangs for s in self.stats.values())
+        worker_stats = self._stats_snapshot()
+        if self._stats_arr is not None:
+            total_iters = int(self._stats_arr['iter'].sum())
+            total_crashes = int(self._stats_arr['crash'].sum())
+            total_hangs = int(self._stats_arr['hang'].sum())
+            total_edges = int(self._stats_arr['edges'].sum())
+        else:
+            total_iters = sum(s.iterations for s in worker_stats.values())
+            total_crashes = sum(s.unique_crashes for s in worker_stats.values())
+            total_hangs = sum(s.unique_hangs for s in worker_stats.values())
+            total_edges = sum(s.coverage_edges for s in worker_stats.values())
 
         print(f"Total Runtime: {runtime:.1f} seconds")
         print(f"Total Iterations: {total_iters:,}")
         print(f"Average Speed: {total_iters / runtime:.1f} execs/sec")
         print(f"Total Unique Crashes: {total_crashes}")
         print(f"Total Unique Hangs: {total_hangs}")
+        if total_edges:
+            print(f"Total Coverage Edges: {total_edges:,}")
         print()
 
         if total_crashes > 0:
@@ -411,6 +1572,7 @@ def main():
     parser.add_argument("-o", "--output", default="fuzz/findings_ai", help="Output directory")
     parser.add_argument("-t", "--time", type=int, default=3600, help="Fuzzing duration (seconds)")
     parser.add_argument("--cpu-only", action="store_true", help="Use CPU only")
+    parser.add_argument("-m", "--model", help="Mutation-guidance model (OpenVINO IR .xml)")
 
     args = parser.parse_args()
 
@@ -434,7 +1596,8 @@ def main():
         fuzz_target=args.target,
         seed_dir=args.input,
         output_dir=args.output,
-        devices=devices
+        devices=devices,
+        model_path=args.model
     )
 
     # Set up signal handler
@@ -0,0 +1,25 @@
+#!/bin/sh
+#
+# Persistent target driver for openvino_fuzzer.py.
+#
+# Spawned once per fuzzing worker; reads length-prefixed inputs from
+# stdin and runs the target once per input, so the fuzzer pays one
+# fork+exec per iteration in the shell instead of rebuilding argv,
+# signal masks and fd plumbing in Python on every call.
+#
+# Protocol (one round per input):
+#   in:  "<length>\n" followed by exactly <length> raw bytes
+#   out: "EXIT=<status>\n" once the target finishes
+#
+# Usage: run_once.sh <target> <input-file>
+
+target="$1"
+input="$2"
+
+while read -r n; do
+    head -c "$n" > "$input" || exit 1
+    # Discard the target's stdout: the wrapper's stdout is the status
+    # pipe, and a chatty target would corrupt the EXIT= framing
+    "$target" "$input" > /dev/null
+    echo "EXIT=$?"
+done